@@ -4,18 +4,83 @@ Script to create Devin knowledge items from all markdown files in a directory.
 Recursively searches subdirectories for .md files.
 """
 import os
+import asyncio
 import httpx
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-def find_markdown_files(directory):
+# File extensions treated as markdown
+MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
+# Directory names never searched for markdown (VCS metadata, caches, build output)
+DEFAULT_EXCLUDE_DIRS = frozenset({
+    ".git", "node_modules", ".venv", "venv", "__pycache__",
+    ".mypy_cache", ".pytest_cache", ".tox", "dist", "build"
+})
+
+# Number of threads reading markdown files ahead of the uploads
+FILE_READ_WORKERS = 4
+
+# Maximum number of knowledge item POSTs in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Maximum number of read files waiting for an upload slot
+UPLOAD_QUEUE_SIZE = 16
+
+# Shared client so all knowledge item POSTs reuse pooled connections.
+# Created lazily by get_client() so the API key is only read once.
+_CLIENT = None
+
+def get_client():
+    """Return the shared Devin API client, creating it on first use.
+    
+    Returns:
+        httpx.AsyncClient with the Authorization and Content-Type headers preconfigured
+        
+    Raises:
+        ValueError: If DEVIN_API_KEY is not set
+    """
+    global _CLIENT
+    
+    if _CLIENT is None:
+        api_key = os.getenv("DEVIN_API_KEY")
+        
+        if not api_key:
+            raise ValueError("DEVIN_API_KEY not found in .env file")
+        
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+    
+    return _CLIENT
+
+async def close_client():
+    """Close the shared Devin API client, if one was created."""
+    global _CLIENT
+    
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+def find_markdown_files(directory, exclude_dirs=None):
     """Recursively find all markdown files in a directory.
     
     Args:
         directory: Root directory to search
+        exclude_dirs: Directory names to skip while searching
+            (defaults to DEFAULT_EXCLUDE_DIRS)
         
     Returns:
         List of Path objects for all .md files found
@@ -28,14 +93,74 @@ def find_markdown_files(directory):
     if not directory_path.is_dir():
         raise ValueError(f"Path is not a directory: {directory}")
     
-    # Find all .md and .markdown files recursively
-    markdown_files = []
-    markdown_files.extend(directory_path.rglob("*.md"))
-    markdown_files.extend(directory_path.rglob("*.markdown"))
+    # Find all .md and .markdown files in a single recursive pass
+    if exclude_dirs is None:
+        exclude_dirs = DEFAULT_EXCLUDE_DIRS
+    markdown_files = [Path(path) for path in _walk_markdown_files(directory_path, exclude_dirs)]
     
     return sorted(markdown_files)
 
-def create_knowledge_item(name, body, trigger_description=None, parent_folder_id=None, pinned_repo=None):
+def _walk_markdown_files(directory, exclude_dirs):
+    """Yield paths of markdown files under directory using one scandir walk.
+    
+    DirEntry type checks use the cached directory listing, so files are matched
+    without an extra stat call each. Subdirectories named in exclude_dirs are
+    pruned without being opened.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude_dirs:
+                    yield from _walk_markdown_files(entry.path, exclude_dirs)
+            elif entry.is_file() and entry.name.endswith(MARKDOWN_EXTENSIONS):
+                yield entry.path
+
+def _knowledge_item_fields(file_path, relative_path, trigger_prefix):
+    """Derive the knowledge item name and trigger description for a file.
+    
+    Args:
+        file_path: Path of the markdown file
+        relative_path: file_path relative to the searched directory, as a string
+        trigger_prefix: Prefix for the trigger description
+        
+    Returns:
+        Tuple of (name, trigger_description)
+    """
+    # Generate name from filename (remove extension)
+    # Include parent directory name if file is in a subdirectory
+    if os.sep in relative_path:
+        # File is in a subdirectory, include parent directory name
+        parent_dir = relative_path.rsplit(os.sep, 2)[-2]
+        name = f"{parent_dir}-{file_path.stem}"
+    else:
+        # File is in root directory, use just the filename
+        name = file_path.stem
+    
+    # Generate trigger description from filename
+    trigger_description = f"{trigger_prefix} {name.replace('-', ' ').replace('_', ' ')}"
+    
+    return name, trigger_description
+
+def _dry_run_plan(file_path, file_str, relative_path, trigger_prefix):
+    """Describe the knowledge item a file would create, without reading it.
+    
+    Returns:
+        Plan dict with the item name, trigger, file path and size in bytes
+    """
+    name, trigger_description = _knowledge_item_fields(file_path, relative_path, trigger_prefix)
+    return {
+        "name": name,
+        "trigger_description": trigger_description,
+        "file_path": file_str,
+        "size": file_path.stat().st_size,
+        "dry_run": True
+    }
+
+def _read_markdown(file_path):
+    """Read a markdown file as UTF-8 without text-mode newline translation."""
+    return file_path.read_bytes().decode('utf-8')
+
+async def create_knowledge_item(name, body, trigger_description=None, parent_folder_id=None, pinned_repo=None):
     """Create a knowledge item in Devin.
     
     Args:
@@ -48,18 +173,10 @@ def create_knowledge_item(name, body, trigger_description=None, parent_folder_id
     Returns:
         API response with created knowledge item details
     """
-    api_key = os.getenv("DEVIN_API_KEY")
-    
-    if not api_key:
-        raise ValueError("DEVIN_API_KEY not found in .env file")
+    client = get_client()
     
     url = "https://api.devin.ai/v1/knowledge"
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
     # Build request body with required fields
     data = {
         "name": name,
@@ -74,17 +191,18 @@ def create_knowledge_item(name, body, trigger_description=None, parent_folder_id
     if pinned_repo:
         data["pinned_repo"] = pinned_repo
     
-    with httpx.Client() as client:
-        response = client.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        return response.json()
+    # orjson encodes straight to bytes, avoiding httpx's stdlib json.dumps pass
+    response = await client.post(url, content=orjson.dumps(data))
+    response.raise_for_status()
+    return response.json()
 
-def create_knowledge_from_markdown_files(
+async def create_knowledge_from_markdown_files(
     directory, 
     trigger_prefix="When working with",
     parent_folder_id=None,
     pinned_repo=None,
-    dry_run=False
+    dry_run=False,
+    exclude_dirs=None
 ):
     """Create knowledge items for all markdown files in a directory.
     
@@ -94,84 +212,156 @@ def create_knowledge_from_markdown_files(
         parent_folder_id: Optional folder ID to organize all knowledge items
         pinned_repo: Optional repository pinning ("all" or "owner/repo")
         dry_run: If True, only show what would be created without actually creating
+        exclude_dirs: Directory names to skip while searching (defaults to DEFAULT_EXCLUDE_DIRS)
         
     Returns:
-        List of created knowledge items
+        List of created knowledge items, or plan dicts when dry_run is True
     """
-    print(f"🔍 Searching for markdown files in: {directory}")
-    markdown_files = find_markdown_files(directory)
-    
-    if not markdown_files:
-        print("❌ No markdown files found")
-        return []
+    if not dry_run:
+        # Fail on a missing API key before walking or reading any files
+        get_client()
     
-    print(f"✅ Found {len(markdown_files)} markdown file(s)\n")
-    
-    created_items = []
-    
-    for idx, file_path in enumerate(markdown_files, 1):
-        print(f"{'='*60}")
-        print(f"📄 Processing {idx}/{len(markdown_files)}: {file_path.name}")
-        print(f"   Path: {file_path.relative_to(directory)}")
-        
-        # Read file content
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except Exception as e:
-            print(f"   ❌ Error reading file: {e}")
-            continue
-        
-        # Generate name from filename (remove extension)
-        # Include parent directory name if file is in a subdirectory
-        relative_path = file_path.relative_to(directory)
-        if len(relative_path.parts) > 1:
-            # File is in a subdirectory, include parent directory name
-            parent_dir = relative_path.parent.name
-            name = f"{parent_dir}-{file_path.stem}"
-        else:
-            # File is in root directory, use just the filename
-            name = file_path.stem
-        
-        # Generate trigger description from filename
-        trigger_description = f"{trigger_prefix} {name.replace('-', ' ').replace('_', ' ')}"
-        
-        print(f"   Name: {name}")
-        print(f"   Trigger: {trigger_description}")
-        print(f"   Size: {len(content)} characters")
+    try:
+        print(f"🔍 Searching for markdown files in: {directory}")
+        markdown_files = find_markdown_files(directory, exclude_dirs)
+        
+        if not markdown_files:
+            print("❌ No markdown files found")
+            return []
+        
+        print(f"✅ Found {len(markdown_files)} markdown file(s)\n")
+        
+        # Path() normalizes the directory and the found files the same way, so each
+        # relative path is a plain suffix of the file path string
+        dir_str = os.fspath(Path(directory))
+        prefix_len = 0 if dir_str == os.curdir else len(dir_str.rstrip(os.sep)) + 1
         
         if dry_run:
-            print(f"   🔸 DRY RUN - Would create knowledge item")
-            created_items.append({
-                "name": name,
-                "file_path": str(file_path),
-                "dry_run": True
-            })
-        else:
-            # Create knowledge item
-            result = create_knowledge_item(
-                name=name,
-                body=content,
-                trigger_description=trigger_description,
-                parent_folder_id=parent_folder_id,
-                pinned_repo=pinned_repo
-            )
+            # Plans only need names and sizes, so skip reading files and the API client
+            plans = []
+            for idx, file_path in enumerate(markdown_files, 1):
+                print(f"{'='*60}")
+                print(f"📄 Processing {idx}/{len(markdown_files)}: {file_path.name}")
+                file_str = os.fspath(file_path)
+                relative_path = file_str[prefix_len:]
+                print(f"   Path: {relative_path}")
+                
+                try:
+                    plan = _dry_run_plan(file_path, file_str, relative_path, trigger_prefix)
+                except OSError as e:
+                    print(f"   ❌ Error reading file: {e}")
+                    continue
+                
+                print(f"   Name: {plan['name']}")
+                print(f"   Trigger: {plan['trigger_description']}")
+                print(f"   Size: {plan['size']} bytes")
+                print(f"   🔸 DRY RUN - Would create knowledge item")
+                print()
+                
+                plans.append(plan)
+            
+            print(f"{'='*60}")
+            print(f"🔸 DRY RUN COMPLETE - Would create {len(plans)} knowledge items")
+            return plans
+        
+        created_items = []
+        # (name, result-or-exception) per queued file, filled in by the consumers
+        outcomes = []
+        
+        # Bounded queue so only a handful of file bodies are held in memory at once
+        queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+        loop = asyncio.get_running_loop()
+        
+        async def enqueue(idx, file_path, read):
+            print(f"{'='*60}")
+            print(f"📄 Processing {idx}/{len(markdown_files)}: {file_path.name}")
+            relative_path = os.fspath(file_path)[prefix_len:]
+            print(f"   Path: {relative_path}")
+            
+            # Read file content
+            try:
+                content = await read
+            except Exception as e:
+                print(f"   ❌ Error reading file: {e}")
+                return
+            
+            name, trigger_description = _knowledge_item_fields(file_path, relative_path, trigger_prefix)
             
-            print(f"   ✅ Created knowledge item")
-            print(f"   ID: {result.get('id')}")
-            print(f"   Created at: {result.get('created_at')}")
+            print(f"   Name: {name}")
+            print(f"   Trigger: {trigger_description}")
+            print(f"   Size: {len(content)} characters")
+            print(f"   ⏳ Queued for creation")
+            print()
             
-            created_items.append(result)
+            outcomes.append(None)
+            await queue.put((len(outcomes) - 1, name, content, trigger_description))
         
-        print()
-    
-    # Summary
-    print(f"{'='*60}")
-    if dry_run:
-        print(f"🔸 DRY RUN COMPLETE - Would create {len(created_items)} knowledge items")
-    else:
+        async def produce():
+            try:
+                with ThreadPoolExecutor(max_workers=FILE_READ_WORKERS) as executor:
+                    # Keep up to FILE_READ_WORKERS reads in flight ahead of the uploads
+                    reads = deque()
+                    for idx, file_path in enumerate(markdown_files, 1):
+                        reads.append((idx, file_path, loop.run_in_executor(executor, _read_markdown, file_path)))
+                        if len(reads) == FILE_READ_WORKERS:
+                            await enqueue(*reads.popleft())
+                    while reads:
+                        await enqueue(*reads.popleft())
+            finally:
+                # One sentinel per consumer so they all shut down
+                for _ in range(MAX_CONCURRENT_REQUESTS):
+                    await queue.put(None)
+        
+        async def consume():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                
+                slot, name, content, trigger_description = item
+                try:
+                    result = await create_knowledge_item(
+                        name=name,
+                        body=content,
+                        trigger_description=trigger_description,
+                        parent_folder_id=parent_folder_id,
+                        pinned_repo=pinned_repo
+                    )
+                except Exception as e:
+                    result = e
+                outcomes[slot] = (name, result)
+        
+        # MAX_CONCURRENT_REQUESTS consumers bound the number of POSTs in flight
+        await asyncio.gather(produce(), *(consume() for _ in range(MAX_CONCURRENT_REQUESTS)))
+        
+        if outcomes:
+            print(f"{'='*60}")
+            print(f"📬 Results for {len(outcomes)} knowledge item(s):\n")
+            
+            for name, result in outcomes:
+                if isinstance(result, Exception):
+                    print(f"   ❌ Failed to create {name}: {result}")
+                    continue
+                
+                print(f"   ✅ Created knowledge item: {name}")
+                print(f"      ID: {result.get('id')}")
+                print(f"      Created at: {result.get('created_at')}")
+                
+                created_items.append(result)
+            
+            print()
+        
+        # Summary
+        print(f"{'='*60}")
         print(f"✅ Successfully created {len(created_items)} knowledge items")
-    
-    return created_items
+        failed = len(outcomes) - len(created_items)
+        if failed:
+            print(f"❌ Failed to create {failed} knowledge items")
+        
+        return created_items
+    finally:
+        # The client is bound to this event loop; close it before asyncio.run() tears it down
+        await close_client()
 
 if __name__ == "__main__":
     # ===== CONFIGURATION =====
@@ -195,10 +385,10 @@ if __name__ == "__main__":
         print("🔸 Running in DRY RUN mode - no knowledge items will be created\n")
     
     # Create knowledge items from markdown files
-    create_knowledge_from_markdown_files(
+    asyncio.run(create_knowledge_from_markdown_files(
         directory=target_directory,
         trigger_prefix=trigger_prefix,
         parent_folder_id=parent_folder_id,
         pinned_repo=pinned_repo,
         dry_run=dry_run
-    )
+    ))
@@ -7,16 +7,40 @@ Completely decoupled from the data generation scripts.
 
 import os
 import sys
+import csv
+import argparse
 import json
 import re
-import requests
-from typing import Optional, Dict, Any, Union
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Union
 from pathlib import Path
-import pandas as pd
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    import httpx
+
+# Compiled once at import instead of on each call
+_ATTACH_RE = re.compile(r'https://app\.devin\.ai/attachments/([a-f0-9\-]+)/([^"]+)')
+_SESSION_ID_RE = re.compile(r'sessions/([a-f0-9\-]+)')
+
+# Pooled Devin API clients, one per API key, shared across calls
+_CLIENTS: Dict[str, "httpx.Client"] = {}
+
+
+def get_client(api_key: str) -> "httpx.Client":
+    """Return the shared HTTP/2 client for an API key, creating it on first use."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        # Imported here so --help and file-only runs skip loading httpx
+        import httpx
+        client = httpx.Client(
+            http2=True,
+            timeout=30.0,
+            headers={"Authorization": f"Bearer {api_key}"},
+            follow_redirects=True
+        )
+        _CLIENTS[api_key] = client
+    return client
 
 
 def read_json_file(filepath: str) -> Optional[Dict[str, Any]]:
@@ -39,7 +63,7 @@ def parse_session_id(session_id_or_url: str) -> Optional[str]:
     """Extract session ID from various formats."""
     # If it's a URL
     if session_id_or_url.startswith('http'):
-        match = re.search(r'sessions/([a-f0-9\-]+)', session_id_or_url)
+        match = _SESSION_ID_RE.search(session_id_or_url)
         if match:
             return f"devin-{match.group(1)}"
         return None
@@ -60,12 +84,12 @@ def get_session_data_from_api(session_id: str, api_key: Optional[str] = None) ->
             return None
     
     url = f"https://api.devin.ai/v1/sessions/{session_id}"
-    headers = {"Authorization": f"Bearer {api_key}"}
     
     try:
-        response = requests.get(url, headers=headers)
+        client = get_client(api_key)
+        response = client.get(url)
         response.raise_for_status()
-        details = response.json()
+        details = orjson.loads(response.content)
         
         # Check for structured_output
         if details.get("structured_output"):
@@ -74,16 +98,18 @@ def get_session_data_from_api(session_id: str, api_key: Optional[str] = None) ->
         # Check for attachments in messages
         messages = details.get("messages", [])
         for msg in reversed(messages[-5:]):
-            msg_text = msg.get("message", "")
-            pattern = r'https://app\.devin\.ai/attachments/([a-f0-9\-]+)/([^"]+)'
-            match = re.search(pattern, msg_text)
+            msg_text = msg.get("message", "") or ""
+            # Cheap substring check skips the regex scan on messages without attachments
+            if "app.devin.ai/attachments/" not in msg_text:
+                continue
+            match = _ATTACH_RE.search(msg_text)
             
             if match:
                 uuid, filename = match.group(1), match.group(2)
                 attachment_url = f"https://api.devin.ai/v1/attachments/{uuid}/{filename}"
-                att_response = requests.get(attachment_url, headers=headers, allow_redirects=True)
+                att_response = client.get(attachment_url)
                 att_response.raise_for_status()
-                return att_response.json()
+                return orjson.loads(att_response.content)
         
         return None
     except Exception as e:
@@ -91,59 +117,89 @@ def get_session_data_from_api(session_id: str, api_key: Optional[str] = None) ->
         return None
 
 
-def format_dependencies_df(deps_data: Union[Dict, list]) -> pd.DataFrame:
-    """Convert dependency data to DataFrame format."""
+# Columns shown first when present, in this order
+PRIORITY_COLUMNS = ['group', 'artifact', 'name', 'version', 'repository', 'needs_upload']
+
+
+def format_dependencies_rows(deps_data: Union[Dict, list]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Extract dependency rows and the column order used to display them.
+    
+    Returns:
+        Tuple of (columns, rows); both are empty if no dependencies are found
+    """
     if not deps_data:
-        return pd.DataFrame()
+        return [], []
+    
+    rows = []
+    reorder = True
     
     # Handle different structures
     if isinstance(deps_data, dict):
         if 'upload_candidates' in deps_data:
-            candidates = deps_data.get('upload_candidates', [])
-            if candidates:
-                df = pd.DataFrame(candidates)
-                # Select and reorder columns for display - prioritize important ones
-                priority_cols = ['group', 'artifact', 'name', 'version', 'repository', 'needs_upload']
-                available_cols = [col for col in priority_cols if col in df.columns]
-                # Add any other columns not in priority list
-                other_cols = [col for col in df.columns if col not in priority_cols]
-                display_cols = available_cols + other_cols
-                if display_cols:
-                    df = df[display_cols]
-                return df
+            rows = deps_data.get('upload_candidates') or []
         elif 'dependencies' in deps_data:
-            deps = deps_data.get('dependencies', [])
-            if deps:
-                return pd.DataFrame(deps)
-    
-    # If data is a list directly
-    if isinstance(deps_data, list) and deps_data:
-        df = pd.DataFrame(deps_data)
-        # Try to reorder columns if they exist
-        priority_cols = ['group', 'artifact', 'name', 'version', 'repository', 'needs_upload']
-        available_cols = [col for col in priority_cols if col in df.columns]
-        other_cols = [col for col in df.columns if col not in priority_cols]
-        if available_cols or other_cols:
-            df = df[available_cols + other_cols]
-        return df
-    
-    return pd.DataFrame()
+            rows = deps_data.get('dependencies') or []
+            reorder = False
+    elif isinstance(deps_data, list):
+        # If data is a list directly
+        rows = deps_data
+    
+    if not rows:
+        return [], []
+    
+    # Plain entries such as "group:artifact:version" strings become a single column
+    rows = [row if isinstance(row, dict) else {'value': row} for row in rows]
+    
+    # Columns in order of first appearance across all rows
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    if reorder:
+        # Prioritize important columns, then any others
+        columns = (
+            [col for col in PRIORITY_COLUMNS if col in columns]
+            + [col for col in columns if col not in PRIORITY_COLUMNS]
+        )
+    
+    return columns, rows
+
+
+def format_dependencies_table(columns: List[str], rows: List[Dict[str, Any]]) -> str:
+    """Render dependency rows as a plain-text table with aligned columns."""
+    cells = [["" if row.get(col) is None else str(row.get(col)) for col in columns] for row in rows]
+    widths = [len(col) for col in columns]
+    for row_cells in cells:
+        for i, cell in enumerate(row_cells):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    
+    lines = [" ".join(col.ljust(width) for col, width in zip(columns, widths)).rstrip()]
+    for row_cells in cells:
+        lines.append(" ".join(cell.ljust(width) for cell, width in zip(row_cells, widths)).rstrip())
+    return "\n".join(lines)
+
+
+def write_dependencies_csv(filename: str, columns: List[str], rows: List[Dict[str, Any]]) -> None:
+    """Write dependency rows to a CSV file with a header row."""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval='')
+        writer.writeheader()
+        writer.writerows(rows)
 
 
 def display_dependencies(data: Dict[str, Any], version_type: str = "both", csv_prefix: Optional[str] = None) -> None:
-    """Display dependency data as formatted DataFrames.
+    """Display dependency data as formatted tables.
     
     Args:
         data: The dependency data to display
         version_type: Which version to display ('current', 'target', or 'both')
-        csv_prefix: If provided, save DataFrames to CSV files with this prefix
+        csv_prefix: If provided, save tables to CSV files with this prefix
     """
     
     if not data:
         print("No data to display")
         return
     
-    csv_files_saved = []
+    # (filename, columns, rows) for each CSV file requested
+    csv_jobs = []
     
     # Check what structure we have
     if 'results' in data:
@@ -153,47 +209,44 @@ def display_dependencies(data: Dict[str, Any], version_type: str = "both", csv_p
         if version_type in ['current', 'both'] and 'current' in res:
             print("\n📊 Current Version Dependencies:")
             print(f"   Version: {data.get('current_version', 'Unknown')}")
-            df = format_dependencies_df(res['current'])
-            if not df.empty:
-                print("\n" + df.to_string(index=False))
-                print(f"\n   Total: {len(df)} dependencies")
+            columns, rows = format_dependencies_rows(res['current'])
+            if rows:
+                print("\n" + format_dependencies_table(columns, rows))
+                print(f"\n   Total: {len(rows)} dependencies")
                 
                 # Save to CSV if requested
                 if csv_prefix:
                     csv_filename = f"{csv_prefix}_current.csv"
-                    df.to_csv(csv_filename, index=False)
-                    csv_files_saved.append(csv_filename)
+                    csv_jobs.append((csv_filename, columns, rows))
             else:
                 print("   No dependencies found")
         
         if version_type in ['target', 'both'] and 'target' in res:
             print("\n📊 Target Version Dependencies:")
             print(f"   Version: {data.get('target_version', 'Unknown')}")
-            df = format_dependencies_df(res['target'])
-            if not df.empty:
-                print("\n" + df.to_string(index=False))
-                print(f"\n   Total: {len(df)} dependencies")
+            columns, rows = format_dependencies_rows(res['target'])
+            if rows:
+                print("\n" + format_dependencies_table(columns, rows))
+                print(f"\n   Total: {len(rows)} dependencies")
                 
                 # Save to CSV if requested
                 if csv_prefix:
                     csv_filename = f"{csv_prefix}_target.csv"
-                    df.to_csv(csv_filename, index=False)
-                    csv_files_saved.append(csv_filename)
+                    csv_jobs.append((csv_filename, columns, rows))
             else:
                 print("   No dependencies found")
     else:
         # Single version results or direct dependency list
         print("\n📊 Dependencies:")
-        df = format_dependencies_df(data)
-        if not df.empty:
-            print("\n" + df.to_string(index=False))
-            print(f"\n   Total: {len(df)} dependencies")
+        columns, rows = format_dependencies_rows(data)
+        if rows:
+            print("\n" + format_dependencies_table(columns, rows))
+            print(f"\n   Total: {len(rows)} dependencies")
             
             # Save to CSV if requested
             if csv_prefix:
                 csv_filename = f"{csv_prefix}.csv"
-                df.to_csv(csv_filename, index=False)
-                csv_files_saved.append(csv_filename)
+                csv_jobs.append((csv_filename, columns, rows))
         else:
             print("   No dependencies found")
     
@@ -215,10 +268,19 @@ def display_dependencies(data: Dict[str, Any], version_type: str = "both", csv_p
         for error in data.get('errors', []):
             print(f"   • {error}")
     
+    # Save CSV files, writing current and target in parallel when both are requested
+    if len(csv_jobs) > 1:
+        with ThreadPoolExecutor(max_workers=len(csv_jobs)) as executor:
+            futures = [executor.submit(write_dependencies_csv, *job) for job in csv_jobs]
+            for future in as_completed(futures):
+                future.result()
+    elif csv_jobs:
+        write_dependencies_csv(*csv_jobs[0])
+    
     # Print CSV save status
-    if csv_files_saved:
+    if csv_jobs:
         print("\n💾 CSV files saved:")
-        for filename in csv_files_saved:
+        for filename, _, _ in csv_jobs:
             print(f"   • {filename}")
 
 
@@ -229,7 +291,7 @@ def main(input_source: str, version_type: str = "both", csv_prefix: Optional[str
     Args:
         input_source: Can be a file path, session ID, or session URL
         version_type: 'current', 'target', or 'both'
-        csv_prefix: If provided, save DataFrames to CSV files with this prefix
+        csv_prefix: If provided, save tables to CSV files with this prefix
     """
     
     # First, try to read as a file
@@ -255,21 +317,33 @@ def main(input_source: str, version_type: str = "both", csv_prefix: Optional[str
 
 def list_available_files(pattern: str = "dependencies_*.json") -> list:
     """List available dependency JSON files in current directory."""
-    from glob import glob
-    files = glob(pattern)
-    if files:
+    from fnmatch import fnmatch
+    # One scandir pass provides both the names and the sizes
+    with os.scandir('.') as it:
+        entries = sorted(
+            (entry.name, entry.stat().st_size)
+            for entry in it
+            if fnmatch(entry.name, pattern) and entry.is_file()
+        )
+    if entries:
         print("\n📁 Available dependency files:")
-        for i, f in enumerate(sorted(files), 1):
-            size = os.path.getsize(f) / 1024  # KB
-            print(f"   {i}. {f} ({size:.1f} KB)")
-        return sorted(files)
+        for i, (name, size) in enumerate(entries, 1):
+            print(f"   {i}. {name} ({size / 1024:.1f} KB)")
+        return [name for name, _ in entries]
     return []
 
 
-if __name__ == "__main__":
-    import argparse
+def cli(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point.
+    
+    Args:
+        argv: Arguments excluding the program name (defaults to sys.argv[1:])
     
+    Returns:
+        Process exit code
+    """
     parser = argparse.ArgumentParser(
+        prog="display_dependencies.py",
         description="Display dependency data from JSON files or Devin sessions",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -322,16 +396,20 @@ Examples:
     parser.add_argument(
         '--csv',
         metavar='PREFIX',
-        help='Save DataFrames to CSV files with the given prefix (e.g., --csv output will create output.csv or output_current.csv and output_target.csv)'
+        help='Save tables to CSV files with the given prefix (e.g., --csv output will create output.csv or output_current.csv and output_target.csv)'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
     
     if args.list:
         files = list_available_files()
         if not files:
             print("No dependency JSON files found in current directory")
-        sys.exit(0)
+        return 0
     
     if not args.input:
         # If no input provided, list available files and prompt
@@ -340,6 +418,11 @@ Examples:
             print("\nPlease specify an input source or use --list to see available files")
         else:
             print("Usage: display_dependencies.py <file/session> [--version current|target|both]")
-        sys.exit(1)
+        return 1
     
     main(args.input, args.version, args.csv)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
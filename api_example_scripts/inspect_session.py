@@ -6,10 +6,9 @@ Quick script to inspect a Devin session and see what data is available.
 import os
 import sys
 import json
-import requests
-from dotenv import load_dotenv
-
-load_dotenv()
+import httpx
+import orjson
+from pathlib import Path
 
 
 def inspect_session(api_key: str, session_id: str):
@@ -20,14 +19,17 @@ def inspect_session(api_key: str, session_id: str):
     print("="*80)
     
     url = f"https://api.devin.ai/v1/sessions/{session_id}"
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
     
     try:
-        response = requests.get(url, headers=headers)
+        with httpx.Client(
+            http2=True,
+            timeout=30.0,
+            headers={"Authorization": f"Bearer {api_key}"},
+            follow_redirects=True
+        ) as client:
+            response = client.get(url)
         response.raise_for_status()
-        details = response.json()
+        details = orjson.loads(response.content)
     except Exception as e:
         print(f"❌ Error fetching session: {e}")
         return None
@@ -76,8 +78,7 @@ def inspect_session(api_key: str, session_id: str):
     
     # Save full details
     output_file = f"session_inspect_{session_id.replace('devin-', '')}.json"
-    with open(output_file, 'w') as f:
-        json.dump(details, f, indent=2)
+    Path(output_file).write_bytes(orjson.dumps(details, option=orjson.OPT_INDENT_2))
     
     print(f"\n💾 Full details saved to: {output_file}")
     
@@ -85,6 +86,9 @@ def inspect_session(api_key: str, session_id: str):
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     api_key = os.environ.get("DEVIN_API_KEY")
     if not api_key:
         print("❌ DEVIN_API_KEY not found")
@@ -7,21 +7,74 @@ Handles both structured_output and attachment-based results.
 import os
 import sys
 import time
+import argparse
 import json
+import math
+import hashlib
+import random
+import itertools
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
-from typing import Optional, Dict, Any
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Polling keeps hitting the same host, possibly from several worker threads:
+# keep those connections open between polls and retry transient gateway errors
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+))
 
-def create_session(api_key: str, repo_name: str, target_version: Optional[str] = None) -> str:
+# Attachment links posted in session messages
+_ATTACHMENT_RE = re.compile(r'https://app\.devin\.ai/attachments/([a-f0-9\-]+)/([^"]+)')
+
+# Last parsed details, ETag and body hash per (session, fields), to skip unchanged poll responses
+_SESSION_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Fields needed while polling; the full session is only fetched once it stops
+POLL_FIELDS = ["status_enum", "structured_output"]
+
+# Completion times of past sessions, used to plan when to poll
+POLL_HISTORY_FILE = Path.home() / ".devin_poll_hist.json"
+POLL_HISTORY_SIZE = 50  # Most recent completion times kept
+MIN_HISTORY_SAMPLES = 5  # Below this, fall back to exponential backoff
+ADAPTIVE_POLLS = 15  # Number of planned polls in an adaptive schedule
+
+# Serializes updates to the poll history file when sessions are awaited concurrently
+_HISTORY_LOCK = threading.Lock()
+
+# Upper bound on sessions analyzed at once by get_java_dependencies_for_repos()
+MAX_CONCURRENT_SESSIONS = 8
+
+
+def log_prefix(label: Optional[str]) -> str:
+    """Return the prefix for progress lines, so concurrent runs can be told apart."""
+    
+    return f"[{label}] " if label else ""
+
+
+def create_session(
+    api_key: str,
+    repo_name: str,
+    target_version: Optional[str] = None,
+    label: Optional[str] = None
+) -> str:
     """Create a Devin session for dependency analysis."""
     
-    print(f"Creating session for {repo_name}...")
+    tag = log_prefix(label)
+    print(f"{tag}Creating session for {repo_name}...")
     
     # Build prompt based on whether target_version is provided
     if target_version:
@@ -81,28 +134,70 @@ When complete, either change your status to finished or blocked (both are fine).
         "idempotent": False  # Set to False to allow multiple sessions
     }
     
-    response = requests.post(url, headers=headers, json=data)
+    response = SESSION.post(url, headers=headers, json=data)
     response.raise_for_status()
     
     result = response.json()
     session_id = result['session_id']
     
-    print(f"✅ Session created: {session_id}")
-    print(f"   View at: {result['url']}")
+    print(f"{tag}✅ Session created: {session_id}")
+    print(f"{tag}   View at: {result['url']}")
     
     return session_id
 
 
-def get_session_details(api_key: str, session_id: str) -> Dict[str, Any]:
-    """Get current session details."""
+def get_session_details(
+    api_key: str,
+    session_id: str,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Get current session details.
+    
+    Args:
+        api_key: Devin API key
+        session_id: Session to fetch
+        fields: Only request these top-level fields (optional, full session if None)
+    
+    Sends the ETag from the previous response as If-None-Match, and returns the
+    previously parsed details when the server answers 304 Not Modified or the
+    response body hashes the same as last time.
+    """
     
     url = f"https://api.devin.ai/v1/sessions/{session_id}"
     headers = {"Authorization": f"Bearer {api_key}"}
+    params = {"fields": ",".join(fields)} if fields else None
+    
+    cache_key = (session_id, tuple(fields) if fields else None)
+    cached = _SESSION_CACHE.get(cache_key)
+    if cached and cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
     
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, headers=headers, params=params)
+    if response.status_code == 304 and cached:
+        return cached["parsed"]
     response.raise_for_status()
     
-    return response.json()
+    # Servers without ETags still often resend identical bodies; skip re-parsing those
+    body_hash = hashlib.blake2b(response.content, digest_size=16).digest()
+    if cached and cached["hash"] == body_hash:
+        details = cached["parsed"]
+    else:
+        details = orjson.loads(response.content)
+    
+    _SESSION_CACHE[cache_key] = {
+        "etag": response.headers.get("ETag"),
+        "hash": body_hash,
+        "parsed": details
+    }
+    return details
+
+
+def forget_session(session_id: str) -> None:
+    """Drop cached get_session_details() responses for a session."""
+    
+    for key in list(_SESSION_CACHE):
+        if key[0] == session_id:
+            _SESSION_CACHE.pop(key, None)
 
 
 def extract_attachment_info(message_text: str) -> Optional[tuple[str, str]]:
@@ -111,131 +206,280 @@ def extract_attachment_info(message_text: str) -> Optional[tuple[str, str]]:
     Returns:
         Tuple of (uuid, filename) or None if no attachment found
     """
-    # Look for attachment pattern
-    pattern = r'https://app\.devin\.ai/attachments/([a-f0-9\-]+)/([^"]+)'
-    match = re.search(pattern, message_text)
-    
-    if match:
-        return match.group(1), match.group(2)
-    
-    return None
+    match = _ATTACHMENT_RE.search(message_text)
+    return (match.group(1), match.group(2)) if match else None
 
 
-def download_attachment(api_key: str, uuid: str, filename: str) -> Dict[str, Any]:
+def download_attachment(
+    api_key: str,
+    uuid: str,
+    filename: str,
+    label: Optional[str] = None
+) -> Dict[str, Any]:
     """Download an attachment from Devin."""
     
-    print(f"Downloading attachment: {filename}...")
+    tag = log_prefix(label)
+    print(f"{tag}Downloading attachment: {filename}...")
     
     url = f"https://api.devin.ai/v1/attachments/{uuid}/{filename}"
     headers = {"Authorization": f"Bearer {api_key}"}
     
     # Use -L equivalent (follow redirects)
-    response = requests.get(url, headers=headers, allow_redirects=True)
+    response = SESSION.get(url, headers=headers, allow_redirects=True)
     response.raise_for_status()
     
     # Parse JSON content
     try:
-        return response.json()
-    except json.JSONDecodeError:
-        print("⚠️  Attachment is not valid JSON")
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        print(f"{tag}⚠️  Attachment is not valid JSON")
         return {"raw_content": response.text}
 
 
+def load_completion_history() -> List[float]:
+    """Load completion times (seconds) of previous sessions."""
+    try:
+        with open(POLL_HISTORY_FILE, 'r') as f:
+            samples = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+    
+    if not isinstance(samples, list):
+        return []
+    return [float(s) for s in samples if isinstance(s, (int, float)) and s > 0]
+
+
+def record_completion_time(seconds: float) -> None:
+    """Append a session completion time to the rolling history file."""
+    with _HISTORY_LOCK:
+        samples = (load_completion_history() + [seconds])[-POLL_HISTORY_SIZE:]
+        try:
+            with open(POLL_HISTORY_FILE, 'w') as f:
+                json.dump(samples, f)
+        except OSError as e:
+            print(f"⚠️  Could not save poll history: {e}")
+
+
+def plan_poll_schedule(
+    samples: List[float],
+    polls: int = ADAPTIVE_POLLS,
+    max_horizon: Optional[float] = None
+) -> Optional[List[float]]:
+    """Plan poll times that minimize expected detection delay.
+    
+    Fits a Gaussian kernel density to past completion times and places polls
+    L_1 < ... < L_k = U (U = 99th percentile, or max_horizon if sooner) following
+    the optimality condition L_{i+1} = L_i + (F(L_i) - F(L_{i-1})) / p(L_i),
+    solving for L_1 by bisection.
+    
+    Returns:
+        Poll times in seconds from session start, or None if history is too short
+    """
+    if len(samples) < MIN_HISTORY_SAMPLES:
+        return None
+    
+    samples = sorted(samples)
+    n = len(samples)
+    
+    # 99th percentile (linear interpolation) bounds the schedule
+    pos = 0.99 * (n - 1)
+    lower = int(pos)
+    upper = min(lower + 1, n - 1)
+    horizon = samples[lower] + (samples[upper] - samples[lower]) * (pos - lower)
+    if max_horizon is not None:
+        horizon = min(horizon, max_horizon)
+    
+    # Silverman's rule of thumb for the kernel bandwidth
+    mean = sum(samples) / n
+    std = math.sqrt(sum((s - mean) ** 2 for s in samples) / n)
+    bandwidth = 1.06 * std * n ** -0.2 or max(1.0, 0.05 * mean)
+    
+    def pdf(x: float) -> float:
+        total = sum(math.exp(-0.5 * ((x - s) / bandwidth) ** 2) for s in samples)
+        return total / (n * bandwidth * math.sqrt(2 * math.pi))
+    
+    def cdf(x: float) -> float:
+        total = sum(1 + math.erf((x - s) / (bandwidth * math.sqrt(2))) for s in samples)
+        return total / (2 * n)
+    
+    def schedule_from(first: float) -> List[float]:
+        points = [first]
+        previous = 0.0
+        while len(points) < polls:
+            current = points[-1]
+            density = pdf(current)
+            if density <= 0:
+                return points + [math.inf]
+            points.append(current + (cdf(current) - cdf(previous)) / density)
+            previous = current
+            if points[-1] > horizon:
+                break
+        return points
+    
+    # Largest first poll whose schedule still ends within the horizon
+    low, high = 0.0, horizon
+    for _ in range(60):
+        mid = (low + high) / 2
+        if schedule_from(mid)[-1] > horizon:
+            high = mid
+        else:
+            low = mid
+    
+    points = schedule_from(low)
+    points[-1] = horizon
+    return points
+
+
 def wait_for_results(
     api_key: str, 
     session_id: str,
     max_wait_minutes: int = 30,
-    poll_interval_seconds: int = 10
+    base_poll_seconds: float = 2.0,
+    max_poll_seconds: float = 30.0,
+    label: Optional[str] = None,
+    stop_event: Optional[threading.Event] = None
 ) -> Dict[str, Any]:
     """
     Wait for session to complete and retrieve results.
     
+    When enough past completion times are recorded, polls follow the adaptive
+    schedule from plan_poll_schedule(). Otherwise polls use truncated exponential
+    backoff with full jitter: each wait is drawn uniformly from
+    [0, min(max_poll_seconds, base_poll_seconds * 2**attempt)]. Once an adaptive
+    schedule is used up, the backoff starts at max_poll_seconds instead. No single
+    wait exceeds max_poll_seconds or runs past max_wait_minutes.
+    
+    label prefixes every progress line. Setting stop_event ends the wait early
+    at the next poll, returning None.
+    
     Returns results from either structured_output or attachment.
     """
     
-    print(f"Waiting for results (max {max_wait_minutes} minutes)...")
+    tag = log_prefix(label)
+    print(f"{tag}Waiting for results (max {max_wait_minutes} minutes)...")
     
-    start_time = time.time()
     max_wait_seconds = max_wait_minutes * 60
     
-    while True:
-        elapsed = time.time() - start_time
-        
-        if elapsed > max_wait_seconds:
-            print(f"❌ Timeout after {max_wait_minutes} minutes")
-            return None
-        
-        # Get current session state
-        details = get_session_details(api_key, session_id)
-        status = details.get("status_enum")
-        
-        # Print status update
-        elapsed_mins = int(elapsed // 60)
-        elapsed_secs = int(elapsed % 60)
-        print(f"   Status: {status} (elapsed: {elapsed_mins}m {elapsed_secs}s)")
-        
-        # Check for completion states
-        if status in ["finished", "expired", "blocked"]:
+    history = load_completion_history()
+    schedule = plan_poll_schedule(history, max_horizon=max_wait_seconds)
+    if schedule:
+        print(f"{tag}   Using adaptive poll schedule from {len(history)} past sessions")
+    
+    start_time = time.time()
+    attempt = 0
+    poll_index = 0
+    
+    # Cached responses hold the full session payload; drop them once the wait ends
+    try:
+        while True:
+            elapsed = time.time() - start_time
+            
+            if elapsed >= max_wait_seconds:
+                print(f"{tag}❌ Timeout after {max_wait_minutes} minutes")
+                return None
             
-            # First check structured_output
-            structured_output = details.get("structured_output")
-            if structured_output:
-                print("✅ Found results in structured_output")
-                return structured_output
+            # Get current session state (status fields only)
+            details = get_session_details(api_key, session_id, fields=POLL_FIELDS)
+            status = details.get("status_enum")
             
-            # If blocked or finished without structured_output, check for attachments
-            if status in ["blocked", "finished"]:
-                print("   Checking for attachments...")
+            # Print status update
+            elapsed_mins = int(elapsed // 60)
+            elapsed_secs = int(elapsed % 60)
+            print(f"{tag}   Status: {status} (elapsed: {elapsed_mins}m {elapsed_secs}s)")
+            
+            # Check for completion states; a terminal status always ends the wait
+            if status in ["finished", "expired", "blocked"]:
                 
-                messages = details.get("messages", [])
-                if messages:
-                    # Check last few messages for attachments
-                    for msg in reversed(messages[-5:]):
-                        msg_text = msg.get("message", "")
-                        attachment_info = extract_attachment_info(msg_text)
-                        
-                        if attachment_info:
-                            uuid, filename = attachment_info
-                            print(f"✅ Found attachment: {filename}")
-                            
-                            # Download and return attachment content
-                            try:
-                                return download_attachment(api_key, uuid, filename)
-                            except Exception as e:
-                                print(f"⚠️  Failed to download attachment: {e}")
+                # Remember how long the task took to improve future poll schedules
+                if status in ["blocked", "finished"]:
+                    record_completion_time(elapsed)
                 
-                # If blocked without results, the task is likely complete
-                if status == "blocked":
-                    print("ℹ️  Session is waiting for instructions (task likely complete)")
-                    print("   No structured output or attachments found")
-                    print("   Check the session URL for manual results")
+                # First check structured_output
+                structured_output = details.get("structured_output")
+                if structured_output:
+                    print(f"{tag}✅ Found results in structured_output")
+                    return structured_output
+                
+                if status == "expired":
+                    print(f"{tag}❌ Session expired")
                     return None
+                
+                # Blocked or finished without structured_output, check for attachments
+                print(f"{tag}   Checking for attachments...")
+                
+                # Polls only fetch status fields; get the full session for its messages
+                details = get_session_details(api_key, session_id)
+                messages = details.get("messages") or []
+                
+                # Lazily scan the last few messages, newest first, for attachments
+                attachments = (
+                    info
+                    for info in (extract_attachment_info(msg.get("message", "")) for msg in itertools.islice(reversed(messages), 5))
+                    if info
+                )
+                for uuid, filename in attachments:
+                    print(f"{tag}✅ Found attachment: {filename}")
+                    
+                    # Download and return attachment content
+                    try:
+                        return download_attachment(api_key, uuid, filename, label=label)
+                    except Exception as e:
+                        print(f"{tag}⚠️  Failed to download attachment: {e}")
+                
+                if status == "blocked":
+                    # If blocked without results, the task is likely complete
+                    print(f"{tag}ℹ️  Session is waiting for instructions (task likely complete)")
+                else:
+                    print(f"{tag}ℹ️  Session finished")
+                print(f"{tag}   No structured output or attachments found")
+                print(f"{tag}   Check the session URL for manual results")
+                return None
+            
+            # Continue polling at the next planned time, if any
+            if schedule and poll_index < len(schedule):
+                # Head for the next planned time; a long gap is split by the cap below
+                delay = start_time + schedule[poll_index] - time.time()
+                if delay <= max_poll_seconds:
+                    poll_index += 1
+            elif schedule:
+                # Past the 99th-percentile horizon a quick finish is unlikely; stay at the cap
+                delay = random.uniform(0, max_poll_seconds)
+            else:
+                # Back off towards max_poll_seconds
+                backoff = min(max_poll_seconds, base_poll_seconds * 2 ** attempt)
+                if backoff < max_poll_seconds:
+                    attempt += 1
+                delay = random.uniform(0, backoff)
+            
+            # Check in at least every max_poll_seconds and never sleep past the limit
+            remaining = max_wait_seconds - (time.time() - start_time)
+            delay = max(0.0, min(delay, max_poll_seconds, remaining))
             
-            if status == "expired":
-                print("❌ Session expired")
+            if stop_event is None:
+                time.sleep(delay)
+            elif stop_event.wait(delay):
+                print(f"{tag}⚠️  Stopped waiting for session {session_id}")
                 return None
-        
-        # Continue polling
-        time.sleep(poll_interval_seconds)
+    finally:
+        forget_session(session_id)
 
 
-def print_summary(results: Dict[str, Any]):
-    """Print a simple summary of the results."""
+def print_summary(results: Dict[str, Any], label: Optional[str] = None):
+    """Print a simple summary of the results, titled with label if given."""
     
     if not results:
         return
     
     print("\n" + "=" * 60)
-    print("RESULTS SUMMARY")
+    print(f"RESULTS SUMMARY: {label}" if label else "RESULTS SUMMARY")
     print("=" * 60)
     
     # Handle different result structures
-    if "results" in results:
+    res = results.get("results")
+    if res is not None:
         # Standard structure
-        res = results["results"]
-        
-        if "current" in res:
-            current = res["current"]
+        current = res.get("current")
+        if current is not None:
             candidates = current.get("upload_candidates", [])
             print(f"\nCurrent Version:")
             print(f"  Upload candidates: {len(candidates)}")
@@ -247,8 +491,8 @@ def print_summary(results: Dict[str, Any]):
                     artifact = f"{c.get('group', '')}:{c.get('artifact', '')}:{c.get('version', '')}"
                     print(f"    • {artifact}")
         
-        if "target" in res:
-            target = res["target"]
+        target = res.get("target")
+        if target is not None:
             candidates = target.get("upload_candidates", [])
             print(f"\nTarget Version:")
             print(f"  Upload candidates: {len(candidates)}")
@@ -263,10 +507,80 @@ def print_summary(results: Dict[str, Any]):
         print("\nResults retrieved (check output file for details)")
 
 
+def get_api_key(api_key: Optional[str] = None) -> str:
+    """Return api_key, or DEVIN_API_KEY from the environment, exiting if neither is set."""
+    
+    if api_key is None:
+        api_key = os.environ.get("DEVIN_API_KEY")
+        if not api_key:
+            print("❌ Error: DEVIN_API_KEY not found in environment")
+            print("   Set it in .env file or as environment variable")
+            sys.exit(1)
+    return api_key
+
+
+def run_dependency_analysis(
+    api_key: str,
+    repo_name: str,
+    target_version: Optional[str] = None,
+    output_file: Optional[str] = None,
+    pretty: bool = False,
+    label: Optional[str] = None,
+    stop_event: Optional[threading.Event] = None,
+    summary: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Create a session for one repository, wait for it and save its results.
+    
+    Args:
+        api_key: Devin API key
+        repo_name: Repository to analyze
+        target_version: Target Orchestra version (optional, current only if not provided)
+        output_file: Where to save the results (optional, timestamped name if None)
+        pretty: Indent the saved JSON for reading (compact by default)
+        label: Prefix for progress lines (optional, used for concurrent runs)
+        stop_event: Event that cancels the wait when set (optional)
+        summary: Print a summary of the results once saved
+    
+    Returns:
+        Dict with dependency results or None if the session produced none.
+        Errors are raised to the caller.
+    """
+    
+    tag = log_prefix(label)
+    
+    # Create session
+    session_id = create_session(api_key, repo_name, target_version, label=label)
+    
+    # Wait for results
+    results = wait_for_results(api_key, session_id, label=label, stop_event=stop_event)
+    
+    if not results:
+        print(f"\n{tag}⚠️  No results retrieved")
+        print(f"{tag}   Check session manually: https://app.devin.ai/sessions/{session_id}")
+        return None
+    
+    # Save results
+    if output_file is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"dependencies_{timestamp}.json"
+    
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 if pretty else None))
+    
+    print(f"\n{tag}✅ Results saved to: {output_file}")
+    
+    # Print summary
+    if summary:
+        print_summary(results)
+    
+    return results
+
+
 def get_java_dependencies(
     repo_name: str,
     target_version: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    pretty: bool = False
 ):
     """Get Java dependencies for a repository.
     
@@ -274,6 +588,7 @@ def get_java_dependencies(
         repo_name: Repository to analyze
         target_version: Target Orchestra version (optional, current only if not provided)
         api_key: Devin API key (optional, uses env var if not provided)
+        pretty: Indent the saved JSON for reading (compact by default)
     
     Returns:
         Dict with dependency results or None. The structure depends on whether 
@@ -314,13 +629,7 @@ def get_java_dependencies(
         - group, artifact, version, type, repository_hint, reason, is_transitive, parents
     """
     
-    # Get API key
-    if api_key is None:
-        api_key = os.environ.get("DEVIN_API_KEY")
-        if not api_key:
-            print("❌ Error: DEVIN_API_KEY not found in environment")
-            print("   Set it in .env file or as environment variable")
-            sys.exit(1)
+    api_key = get_api_key(api_key)
     
     # Print configuration
     print(f"\n📋 Configuration:")
@@ -332,30 +641,7 @@ def get_java_dependencies(
         print(f"   Mode: Current version only")
     
     try:
-        # Create session
-        session_id = create_session(api_key, repo_name, target_version)
-        
-        # Wait for results
-        results = wait_for_results(api_key, session_id)
-        
-        if results:
-            # Save results
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"dependencies_{timestamp}.json"
-            
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=2)
-            
-            print(f"\n✅ Results saved to: {output_file}")
-            
-            # Print summary
-            print_summary(results)
-        else:
-            print("\n⚠️  No results retrieved")
-            print(f"   Check session manually: https://app.devin.ai/sessions/{session_id}")
-            return None
-        
-        return results
+        return run_dependency_analysis(api_key, repo_name, target_version, pretty=pretty)
             
     except KeyboardInterrupt:
         print("\n⚠️  Interrupted by user")
@@ -365,9 +651,94 @@ def get_java_dependencies(
         sys.exit(1)
 
 
+def get_java_dependencies_for_repos(
+    repos: List[Tuple[str, Optional[str]]],
+    api_key: Optional[str] = None,
+    max_workers: int = MAX_CONCURRENT_SESSIONS,
+    pretty: bool = False
+) -> Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]]:
+    """Get Java dependencies for several repositories concurrently.
+    
+    Sessions run server-side, so each (repository, target) job gets a worker
+    thread that creates its session and polls it while the others do the same;
+    total wall-clock time is close to the slowest session rather than the sum.
+    
+    Args:
+        repos: (repo_name, target_version) pairs; target_version may be None.
+            The same repository may be listed with different targets; exact
+            duplicates are analyzed once.
+        api_key: Devin API key (optional, uses env var if not provided)
+        max_workers: Maximum number of sessions in flight at once
+        pretty: Indent the saved JSON for reading (compact by default)
+    
+    Returns:
+        Dict mapping each (repo_name, target_version) pair to its results (same
+        structure as get_java_dependencies), or None if it failed or produced
+        no results. Each job's results are saved to its own
+        dependencies_<repo>_<target or "current">_<timestamp>.json file.
+    
+    Progress lines are prefixed with repo_name, or repo_name@target_version.
+    On Ctrl-C, pending jobs are cancelled and running ones stop at their next poll.
+    """
+    
+    api_key = get_api_key(api_key)
+    
+    jobs = list(dict.fromkeys(repos))
+    print(f"\n📋 Analyzing {len(jobs)} repository job(s) (up to {max_workers} at a time)")
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    all_results: Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]] = {}
+    stop_event = threading.Event()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for repo_name, target_version in jobs:
+            label = f"{repo_name}@{target_version}" if target_version else repo_name
+            output_file = f"dependencies_{repo_name.replace('/', '_')}_{target_version or 'current'}_{timestamp}.json"
+            future = pool.submit(
+                run_dependency_analysis,
+                api_key,
+                repo_name,
+                target_version,
+                output_file=output_file,
+                pretty=pretty,
+                label=label,
+                stop_event=stop_event,
+                summary=False
+            )
+            futures[future] = ((repo_name, target_version), label)
+        
+        try:
+            for future in as_completed(futures):
+                job, label = futures[future]
+                try:
+                    all_results[job] = future.result()
+                except Exception as e:
+                    print(f"\n❌ Error analyzing {label}: {e}")
+                    all_results[job] = None
+                    continue
+                
+                # Summaries are printed here so their lines don't interleave across workers
+                print_summary(all_results[job], label=label)
+        except KeyboardInterrupt:
+            print("\n⚠️  Interrupted by user, stopping running sessions...")
+            stop_event.set()
+            for future in futures:
+                future.cancel()
+            raise
+    
+    succeeded = sum(1 for results in all_results.values() if results)
+    print(f"\n✅ {succeeded}/{len(jobs)} repository job(s) returned results")
+    
+    return all_results
+
 if __name__ == "__main__":
     # Example usage - change these values as needed
     REPO = "wftgitsas-CHIEF-TECH-OFC-NonProd/App-ciwat-FCDEvidenceService-DevinPOC"
     TARGET = "3.17"  # Set to None for current version only
     
-    results = get_java_dependencies(REPO, TARGET)
+    parser = argparse.ArgumentParser(description="Run Java dependency analysis using Devin API")
+    parser.add_argument("--pretty", action="store_true", help="Save indented JSON instead of compact JSON")
+    args = parser.parse_args()
+    
+    results = get_java_dependencies(REPO, TARGET, pretty=args.pretty)
@@ -12,6 +12,17 @@ from datetime import datetime
 
 load_dotenv()
 
+# Plain session for the single listing request this script makes
+SESSION = requests.Session()
+
+# Status emoji shown next to each session
+_STATUS_EMOJI = {
+    'working': '🔄',
+    'blocked': '⏸️',
+    'finished': '✅',
+    'expired': '❌'
+}
+
 
 def list_sessions(api_key: str, limit: int = 10):
     """List recent Devin sessions."""
@@ -26,7 +37,7 @@ def list_sessions(api_key: str, limit: int = 10):
     }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
         response.raise_for_status()
         data = response.json()
         
@@ -61,23 +72,17 @@ def list_sessions(api_key: str, limit: int = 10):
         status = session.get('status_enum', 'unknown')
         created = session.get('created_at', 'N/A')
         
-        # Parse timestamp
+        # Parse timestamp (fromisoformat only accepts a trailing 'Z' on Python 3.11+)
         if created != 'N/A':
+            iso = created[:-1] + '+00:00' if created.endswith('Z') else created
             try:
-                dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                created_str = dt.strftime('%Y-%m-%d %H:%M:%S')
-            except:
+                created_str = datetime.fromisoformat(iso).strftime('%Y-%m-%d %H:%M:%S')
+            except ValueError:
                 created_str = created
         else:
             created_str = 'N/A'
         
-        # Status emoji
-        status_emoji = {
-            'working': '🔄',
-            'blocked': '⏸️',
-            'finished': '✅',
-            'expired': '❌'
-        }.get(status, '❓')
+        status_emoji = _STATUS_EMOJI.get(status, '❓')
         
         print(f"{i}. {status_emoji} {title}")
         print(f"   ID: {session_id}")
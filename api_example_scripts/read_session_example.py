@@ -3,17 +3,25 @@
 Example script showing how to use display_dependencies.py to read dependency data.
 """
 
-import subprocess
 import sys
 import os
+import traceback
+
+import display_dependencies
 
 def run_display_command(args):
-    """Run the display_dependencies.py script with given arguments."""
-    cmd = [sys.executable, "display_dependencies.py"] + args
-    print(f"Running: {' '.join(cmd)}")
+    """Run display_dependencies.py in-process with given arguments."""
+    print(f"Running: display_dependencies.py {' '.join(args)}")
     print("=" * 60)
-    result = subprocess.run(cmd, capture_output=False, text=True)
-    return result.returncode
+    try:
+        return display_dependencies.cli(args)
+    except SystemExit as e:
+        # argparse exits on --help or invalid arguments
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        # Report failures like a crashed subprocess would
+        traceback.print_exc()
+        return 1
 
 def main():
     """Example usage of the display_dependencies script."""
@@ -3,8 +3,35 @@
 Test script to verify the naming logic without requiring httpx.
 """
 import os
+import shutil
+import subprocess
 from pathlib import Path
 
+MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
+def _find_with_fd(directory_path):
+    """List markdown files with fd (parallel, native walk), or None if fd is unavailable."""
+    # Debian/Ubuntu ship the binary as fdfind
+    fd = shutil.which("fd") or shutil.which("fdfind")
+    if not fd:
+        return None
+    
+    # --hidden/--no-ignore match os.walk, which does not skip dotfiles or gitignored paths.
+    # os.walk also lists symlinks (except those to directories) as files, hence --type l.
+    command = [fd, "--type", "f", "--type", "l", "--hidden", "--no-ignore", "--print0",
+               "-e", "md", "-e", "markdown", ".", str(directory_path)]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    
+    # fd matches extensions case-insensitively and lists directory symlinks;
+    # drop both so the result is the same set os.walk finds
+    return [
+        Path(p) for p in result.stdout.split("\0")
+        if p.endswith(MARKDOWN_EXTENSIONS) and not os.path.isdir(p)
+    ]
+
 def find_markdown_files(directory):
     """Recursively find all markdown files in a directory."""
     directory_path = Path(directory)
@@ -15,10 +42,15 @@ def find_markdown_files(directory):
     if not directory_path.is_dir():
         raise ValueError(f"Path is not a directory: {directory}")
     
-    # Find all .md and .markdown files recursively
-    markdown_files = []
-    markdown_files.extend(directory_path.rglob("*.md"))
-    markdown_files.extend(directory_path.rglob("*.markdown"))
+    # Prefer fd on large trees, otherwise find all .md and .markdown files in a single recursive walk
+    markdown_files = _find_with_fd(directory_path)
+    if markdown_files is None:
+        markdown_files = [
+            Path(root) / name
+            for root, _, files in os.walk(directory_path)
+            for name in files
+            if name.endswith(MARKDOWN_EXTENSIONS)
+        ]
     
     return sorted(markdown_files)
 
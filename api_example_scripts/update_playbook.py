@@ -7,13 +7,21 @@ Reads the playbook markdown file and updates it in Devin settings.
 import os
 import sys
 import json
+import hashlib
 import requests
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Plain session so the list and update calls share one connection to the API
+SESSION = requests.Session()
+
+# Checksums of previously loaded playbook files, keyed by path and validated by mtime/size
+PLAYBOOK_CACHE_FILE = Path(__file__).parent / ".playbook_cache.json"
+
 
 def list_playbooks(api_key: str) -> list:
     """List all playbooks for the organization."""
@@ -25,7 +33,7 @@ def list_playbooks(api_key: str) -> list:
         "Authorization": f"Bearer {api_key}"
     }
     
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, headers=headers)
     response.raise_for_status()
     
     playbooks = response.json()
@@ -67,7 +75,7 @@ def update_playbook(
         "macro": macro
     }
     
-    response = requests.put(url, headers=headers, json=data)
+    response = SESSION.put(url, headers=headers, json=data)
     response.raise_for_status()
     
     result = response.json()
@@ -92,6 +100,53 @@ def load_playbook_file(file_path: str) -> str:
     return content
 
 
+def playbook_checksum(body: str) -> str:
+    """Return the SHA-256 hex digest of a playbook body."""
+    
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def load_playbook_cache() -> dict:
+    """Load the playbook checksum cache, or an empty one if missing or corrupt."""
+    
+    try:
+        return json.loads(PLAYBOOK_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def cached_playbook_checksum(file_path: str) -> Optional[str]:
+    """Return the cached checksum of a playbook file if it is unchanged on disk."""
+    
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Playbook file not found: {file_path}")
+    
+    stat = path.stat()
+    entry = load_playbook_cache().get(str(path.resolve()))
+    if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+        return entry.get("sha256")
+    return None
+
+
+def save_playbook_checksum(file_path: str, checksum: str) -> None:
+    """Record a playbook file's checksum along with its mtime and size."""
+    
+    path = Path(file_path)
+    stat = path.stat()
+    cache = load_playbook_cache()
+    cache[str(path.resolve())] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": checksum
+    }
+    
+    try:
+        PLAYBOOK_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+    except OSError:
+        pass  # The cache is only an optimization
+
+
 def main(
     macro: str = "!get_java_deps",
     title: str = "Java Dependency Discovery",
@@ -123,9 +178,16 @@ def main(
         script_dir = Path(__file__).parent
         playbook_file = script_dir / "find-java-deps-playbook.md"
     
-    # Load playbook content
+    # Load playbook content, unless the cache shows the file is unchanged
     try:
-        body = load_playbook_file(playbook_file)
+        body = None
+        local_checksum = cached_playbook_checksum(playbook_file)
+        if local_checksum is None:
+            body = load_playbook_file(playbook_file)
+            local_checksum = playbook_checksum(body)
+            save_playbook_checksum(playbook_file, local_checksum)
+        else:
+            print(f"📄 Playbook file unchanged since last run: {playbook_file}")
     except FileNotFoundError as e:
         print(f"❌ {e}")
         sys.exit(1)
@@ -158,6 +220,18 @@ def main(
     playbook_id = playbook["playbook_id"]
     print(f"✅ Found playbook: {playbook['title']} (ID: {playbook_id})")
     
+    # Skip the update entirely if the stored playbook already matches
+    if (
+        playbook.get("title") == title
+        and playbook.get("macro") == macro
+        and playbook_checksum(playbook.get("body") or "") == local_checksum
+    ):
+        print("\n✅ No changes: playbook is already up to date")
+        return
+    
+    if body is None:
+        body = load_playbook_file(playbook_file)
+    
     # Update the playbook
     try:
         result = update_playbook(
@@ -1,5 +1,12 @@
 import os
+import shutil
+import hashlib
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
 
 # ---- Configuration ----
 ON_PREM_URL = "https://artifactory.wellsfargo.com/artifactory"  
@@ -12,61 +19,330 @@ SAAS_REPO = "prod-devin-java"
 SAAS_USER = "EBSSH_JFROG_SVC_PRD"
 SAAS_PASSWORD = "<your_jfrog_token>"
 
+# Path to the corporate CA bundle (PEM). When unset, TLS verification is
+# disabled as before; setting it is strongly preferred.
+CA_BUNDLE = os.environ.get("ARTIFACTORY_CA_BUNDLE")
+
+# Buffer size for copying downloads to disk
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Parallel transfers; keep low (1-20) to avoid overloading the proxies
+TRANSFER_WORKERS = 3
+
+# Large downloads are split into parallel byte ranges; ~4 streams per file
+# keeps the proxies happy while filling high-latency links
+RANGE_PARTS = 4
+RANGE_MIN_SIZE = 16 * 1024 * 1024
+
 ARTIFACTS = [
     "com/wellsfargo/ebssh/orchestra/loglib-logback-spring-starter/3.17.0/loglib-logback-spring-starter-3.17.0.jar"
 ]
 
-def download_to_cwd(artifact_path: str) -> str:
-    """Download artifact and save it to the current working directory."""
+# Shared session so transfers reuse pooled TLS connections to both Artifactory hosts.
+# Only GET/HEAD are retried: streamed upload bodies cannot be replayed.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"GET", "HEAD"})
+    )
+))
+# Passed on every call: a session-level verify would be overridden by
+# REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE from the environment
+SESSION_VERIFY = CA_BUNDLE or False
+
+# Silence the per-request InsecureRequestWarning once instead of on every call
+if not CA_BUNDLE:
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+class SizedStream:
+    """File-like wrapper that gives requests the length of a streamed response body.
+
+    requests sizes a raw urllib3 response via fileno() and fails on it, so the
+    upload wraps r.raw in this instead.
+
+    There is deliberately no __iter__: requests accepts this as a raw body only
+    because it has read(), and takes Content-Length from __len__. Without read()
+    it would be form-encoded; without __len__ the upload would have no length.
+    """
+
+    def __init__(self, raw, size: int):
+        self.raw = raw
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def read(self, amt: int = -1) -> bytes:
+        return self.raw.read(None if amt is None or amt < 0 else amt)
+
+
+def _download_range(url: str, fd: int, start: int, end: int) -> bool:
+    """Write bytes start..end of url into fd at the same offset.
+
+    Returns False if the server ignored the Range header.
+    """
+    headers = {"Range": f"bytes={start}-{end}"}
+    with SESSION.get(url, auth=(ON_PREM_USER, ON_PREM_PASSWORD), headers=headers,
+                     stream=True, verify=SESSION_VERIFY) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            return False
+
+        offset = start
+        for chunk in r.iter_content(chunk_size=COPY_CHUNK_SIZE):
+            view = memoryview(chunk)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                offset += written
+                view = view[written:]
+
+    if offset != end + 1:
+        raise IOError(f"Short read for bytes {start}-{end}: got {offset - start} bytes")
+    return True
+
+
+def download_in_ranges(url: str, local_path: str, size: int) -> bool:
+    """Download url into local_path using RANGE_PARTS parallel Range requests.
+
+    Returns False if the server does not honour Range, so the caller can
+    fall back to a single stream.
+    """
+    part = -(-size // RANGE_PARTS)
+    ranges = [(start, min(start + part, size) - 1) for start in range(0, size, part)]
+
+    fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.ftruncate(fd, size)
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            results = list(pool.map(lambda r: _download_range(url, fd, *r), ranges))
+    finally:
+        os.close(fd)
+    return all(results)
+
+
+def range_download_size(head: requests.Response) -> int:
+    """Return the artifact size if a HEAD response allows a parallel range download, else 0.
+
+    Ranges only pay off for large files and only make sense for unencoded bodies.
+    """
+    if not head.ok or not hasattr(os, "pwrite"):
+        return 0
+    if head.headers.get("Accept-Ranges") != "bytes":
+        return 0
+    if head.headers.get("Content-Encoding", "identity") != "identity":
+        return 0
+    total = int(head.headers.get("Content-Length", 0))
+    return total if total >= RANGE_MIN_SIZE else 0
+
+
+def download_to_cwd(artifact_path: str, head: Optional[requests.Response] = None) -> str:
+    """Download artifact and save it to the current working directory.
+
+    Args:
+        artifact_path: Path of the artifact within the on-prem repository
+        head: Response of an earlier HEAD on the artifact (optional, sent here if None)
+    """
     url = f"{ON_PREM_URL}/{ON_PREM_REPO}/{artifact_path}"
     print(f"[INFO] Downloading from: {url}")
 
-    with requests.get(url, auth=(ON_PREM_USER, ON_PREM_PASSWORD), stream=True, verify=False) as r:
-        print(f"[INFO] Download status: {r.status_code}")
-        r.raise_for_status()
+    filename = os.path.basename(artifact_path)
+    local_path = os.path.join(os.getcwd(), filename)
 
-        filename = os.path.basename(artifact_path)
-        local_path = os.path.join(os.getcwd(), filename)
+    if head is None:
+        head = SESSION.head(url, auth=(ON_PREM_USER, ON_PREM_PASSWORD), allow_redirects=True, verify=SESSION_VERIFY)
+    total = range_download_size(head)
 
-        with open(local_path, "wb") as f:
-            for chunk in r.iter_content(8192):
-                if chunk:
-                    f.write(chunk)
+    if total and download_in_ranges(url, local_path, total):
+        print(f"[INFO] Downloaded in {RANGE_PARTS} parallel ranges")
+    else:
+        with SESSION.get(url, auth=(ON_PREM_USER, ON_PREM_PASSWORD), stream=True, verify=SESSION_VERIFY) as r:
+            print(f"[INFO] Download status: {r.status_code}")
+            r.raise_for_status()
+
+            # Copy the raw stream in 1 MiB chunks without a Python-level chunk loop
+            r.raw.decode_content = True
+            with open(local_path, "wb") as f:
+                shutil.copyfileobj(r.raw, f, length=COPY_CHUNK_SIZE)
 
     size = os.path.getsize(local_path)
     print(f"[INFO] Saved to {local_path} ({size} bytes)")
     return local_path
 
 
-def upload_file(artifact_path: str, local_file: str) -> None:
-    """Upload local file to SaaS Artifactory."""
+def file_sha256(local_file: str) -> str:
+    """Return the SHA-256 hex digest of a local file."""
+    digest = hashlib.sha256()
+    with open(local_file, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def head_sha256(head: requests.Response) -> Optional[str]:
+    """Return the SHA-256 Artifactory reports in a HEAD response, or None if it is missing."""
+    if head.status_code != 200:
+        return None
+    return head.headers.get("X-Checksum-Sha256")
+
+
+def remote_sha256(url: str, auth: tuple) -> Optional[str]:
+    """Return the SHA-256 Artifactory reports for url, or None if it is missing."""
+    return head_sha256(SESSION.head(url, auth=auth, allow_redirects=True, verify=SESSION_VERIFY))
+
+
+def checksum_deploy(url: str, sha256: str) -> bool:
+    """Deploy to SaaS Artifactory by checksum alone, without sending the body.
+
+    Returns False if Artifactory does not already store content with that checksum,
+    or refuses checksum deploys for the repository (any 4xx), so a real upload is needed.
+    """
+    headers = {
+        "X-Checksum-Deploy": "true",
+        "X-Checksum-Sha256": sha256
+    }
+    r = SESSION.put(url, headers=headers, auth=(SAAS_USER, SAAS_PASSWORD), verify=SESSION_VERIFY)
+    if 400 <= r.status_code < 500:
+        return False
+    r.raise_for_status()
+    return True
+
+
+def skip_or_checksum_deploy(url: str, sha256: str) -> bool:
+    """Return True if the destination needs no upload because it has, or could link, this content."""
+    if remote_sha256(url, (SAAS_USER, SAAS_PASSWORD)) == sha256:
+        print(f"[INFO] Destination already has identical content, skipping upload")
+        return True
+    if checksum_deploy(url, sha256):
+        print(f"[INFO] Deployed by checksum, no upload needed")
+        return True
+    return False
+
+
+def upload_file(artifact_path: str, local_file: str, check_existing: bool = True) -> bool:
+    """Upload local file to SaaS Artifactory.
+
+    Args:
+        artifact_path: Path of the artifact within the SaaS repository
+        local_file: File to upload
+        check_existing: Skip the upload if the destination has, or can link, the content
+
+    Returns:
+        True if the file was uploaded, False if the upload was skipped
+    """
     url = f"{SAAS_URL}/{SAAS_REPO}/{artifact_path}"
+    sha256 = file_sha256(local_file)
+    if check_existing and skip_or_checksum_deploy(url, sha256):
+        return False
+
     size = os.path.getsize(local_file)
     headers = {
         "Content-Type": "application/octet-stream",
-        "Content-Length": str(size)
+        "Content-Length": str(size),
+        "X-Checksum-Sha256": sha256
     }
 
     print(f"[INFO] Uploading {local_file} -> {url} ({size} bytes)")
     with open(local_file, "rb") as f:
-        r = requests.put(url, data=f, headers=headers, auth=(SAAS_USER, SAAS_PASSWORD), verify=False)
+        r = SESSION.put(url, data=f, headers=headers, auth=(SAAS_USER, SAAS_PASSWORD), verify=SESSION_VERIFY)
 
     print(f"[INFO] Upload status: {r.status_code}")
     r.raise_for_status()
     print(f"[INFO] Uploaded OK")
+    return True
 
 
-if __name__ == "__main__":
-    print("[INFO] Starting migration of dependencies...")
-    for artifact in ARTIFACTS:
-        try:
-            print(f"[INFO] Transferring {artifact}...")
-            local_path = download_to_cwd(artifact)
-            print(f"[INFO] Downloaded {artifact} to {local_path}")
-            upload_file(artifact, local_path)
+def download_and_stream_upload(artifact_path: str) -> bool:
+    """Pipe an artifact from on-prem straight into the SaaS upload without touching disk.
+
+    Artifacts whose source checksum the destination already has are skipped
+    without downloading. Large artifacts the source serves in byte ranges are
+    downloaded to disk in parallel ranges first, since a single stream is limited
+    by one TCP connection. The upload needs the size up front, so when the source
+    sends no Content-Length (or a compressed body) this also goes through
+    download_to_cwd + upload_file.
+
+    Returns:
+        True if the artifact was uploaded, False if the destination already had it
+    """
+    src_url = f"{ON_PREM_URL}/{ON_PREM_REPO}/{artifact_path}"
+    dst_url = f"{SAAS_URL}/{SAAS_REPO}/{artifact_path}"
+
+    src_head = SESSION.head(src_url, auth=(ON_PREM_USER, ON_PREM_PASSWORD), allow_redirects=True, verify=SESSION_VERIFY)
+    src_sha256 = head_sha256(src_head)
+    if src_sha256 and skip_or_checksum_deploy(dst_url, src_sha256):
+        return False
+
+    # Already checked against the source checksum above, if there was one
+    check_existing = src_sha256 is None
+
+    if range_download_size(src_head):
+        print(f"[INFO] Large artifact, downloading in parallel ranges before upload")
+        local_path = download_to_cwd(artifact_path, head=src_head)
+        return upload_file(artifact_path, local_path, check_existing=check_existing)
+
+    print(f"[INFO] Streaming {src_url} -> {dst_url}")
+
+    with SESSION.get(src_url, auth=(ON_PREM_USER, ON_PREM_PASSWORD), stream=True, verify=SESSION_VERIFY) as r:
+        print(f"[INFO] Download status: {r.status_code}")
+        r.raise_for_status()
+
+        size = r.headers.get("Content-Length")
+        if size is not None and r.headers.get("Content-Encoding", "identity") == "identity":
+            headers = {
+                "Content-Type": "application/octet-stream",
+                "Content-Length": size
+            }
+            if src_sha256:
+                headers["X-Checksum-Sha256"] = src_sha256
+            print(f"[INFO] Uploading {size} bytes")
+            body = SizedStream(r.raw, int(size))
+            up = SESSION.put(dst_url, data=body, headers=headers, auth=(SAAS_USER, SAAS_PASSWORD), verify=SESSION_VERIFY)
+            print(f"[INFO] Upload status: {up.status_code}")
+            up.raise_for_status()
+            print(f"[INFO] Uploaded OK")
+            return True
+
+    print(f"[INFO] Source size unknown, transferring via a local copy")
+    local_path = download_to_cwd(artifact_path, head=src_head)
+    return upload_file(artifact_path, local_path, check_existing=check_existing)
+
+
+def transfer_artifacts(artifacts: list, workers: int = TRANSFER_WORKERS) -> int:
+    """Transfer artifacts concurrently, returning the number of failures.
+
+    Each transfer streams the download directly into the upload, so both
+    network legs of an artifact run at the same time.
+    """
+    failures = 0
+    with ThreadPoolExecutor(workers) as pool:
+        transfers = {pool.submit(download_and_stream_upload, artifact): artifact for artifact in artifacts}
+
+        for future in as_completed(transfers):
+            artifact = transfers[future]
+            try:
+                uploaded = future.result()
+            except Exception as e:
+                print(f"[ERROR] Failed to transfer {artifact}: {e}")
+                failures += 1
+                continue
+            if not uploaded:
+                print(f"[SKIPPED] {artifact} already present in {SAAS_URL}/{SAAS_REPO}")
+                continue
             print(f"[INFO] Uploaded {artifact} to {SAAS_URL}/{SAAS_REPO}/{artifact}")
             print(f"[SUCCESS] Transferred {artifact}")
-        except Exception as e:
-            print(f"[ERROR] Failed to transfer {artifact}: {e}")
+
+    return failures
+
+
+if __name__ == "__main__":
+    print("[INFO] Starting migration of dependencies...")
+    failures = transfer_artifacts(ARTIFACTS)
+    print(f"[INFO] Transferred {len(ARTIFACTS) - failures}/{len(ARTIFACTS)} artifacts")
     
-# pip install requests
\ No newline at end of file
+# pip install requests